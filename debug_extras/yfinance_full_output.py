@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import yfinance as yf
 
 # --- Configuration for Table Formatting ---
@@ -6,6 +8,10 @@ COL_WIDTHS = [28, 18, 18, 18, 18]
 # Define column alignments: 'l' for left, 'r' for right
 COL_ALIGNMENTS = ["l", "r", "r", "r", "r"]
 HEADERS = ["Info Key", "Batch Fast", "Ind. Fast", "Batch Slow", "Ind. Slow"]
+# Separator lines spanning the full table width (columns plus joining spaces).
+TABLE_WIDTH = sum(COL_WIDTHS) + len(COL_WIDTHS) - 1
+SEP_LINE = "-" * TABLE_WIDTH
+HEADER_LINE = "=" * TABLE_WIDTH
 
 
 def format_row(items: list, widths: list[int], alignments: list[str]) -> str:
@@ -53,18 +59,48 @@ def compare_ticker_info(tickers_to_test: list[str]):
         print(f"Failed to create batch Tickers object: {e}")
         return
 
+    def _fetch_all_info(ticker: str) -> tuple:
+        """Fetches the four info dictionaries for a single ticker."""
+        individual_ticker = yf.Ticker(ticker)
+        # fast_info is lazy: each key triggers its own request on first access,
+        # so materialise it here rather than in the (serial) formatting loop.
+        return (
+            dict(batch_tickers.tickers[ticker].fast_info.items()),
+            batch_tickers.tickers[ticker].info,
+            dict(individual_ticker.fast_info.items()),
+            individual_ticker.info,
+        )
+
+    # Each .info access is a blocking HTTP round-trip, so fetch all tickers
+    # concurrently and keep either the results or the exception per ticker.
+    results: dict[str, tuple | Exception] = {}
+    with ThreadPoolExecutor(max_workers=min(32, 4 * len(tickers_to_test))) as executor:
+        futures = {
+            executor.submit(_fetch_all_info, ticker): ticker
+            for ticker in tickers_to_test
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                results[ticker] = e
+
     for ticker in tickers_to_test:
-        print("-" * sum(COL_WIDTHS) + "-" * (len(COL_WIDTHS) - 1))
+        print(SEP_LINE)
         print(f"Ticker: {ticker}")
-        print("-" * sum(COL_WIDTHS) + "-" * (len(COL_WIDTHS) - 1))
+        print(SEP_LINE)
 
         try:
-            # Fetch all four data dictionaries
-            batch_fast_info = batch_tickers.tickers[ticker].fast_info
-            batch_slow_info = batch_tickers.tickers[ticker].info
-            individual_ticker = yf.Ticker(ticker)
-            individual_fast_info = individual_ticker.fast_info
-            individual_slow_info = individual_ticker.info
+            result = results[ticker]
+            if isinstance(result, Exception):
+                raise result
+            (
+                batch_fast_info,
+                batch_slow_info,
+                individual_fast_info,
+                individual_slow_info,
+            ) = result
 
             # Combine all unique keys
             all_keys = sorted(
@@ -78,7 +114,7 @@ def compare_ticker_info(tickers_to_test: list[str]):
 
             # Print table header
             print(format_row(HEADERS, COL_WIDTHS, COL_ALIGNMENTS))
-            print("=" * sum(COL_WIDTHS) + "=" * (len(COL_WIDTHS) - 1))
+            print(HEADER_LINE)
 
             # Process and print each row
             for key in all_keys:
@@ -1,41 +1,126 @@
+import bisect
+import random
+import threading
+import time
 import requests
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
-from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_URL = "https://api.stlouisfed.org/fred"
-_series_cache: Dict[str, Any] = {}
-_info_cache: Dict[str, Any] = {}
+
+# PERF: A shared Session keeps the TLS connection to api.stlouisfed.org alive
+# between calls, instead of paying a fresh TCP + TLS handshake per request.
+# Transient server errors and rate-limit responses are retried with backoff.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+_session.headers.update({"Accept-Encoding": "gzip"})
+
 CACHE_DURATION_SECONDS = 300  # 5 minutes
+# Series metadata (title, units, frequency) changes very rarely.
+INFO_CACHE_DURATION_SECONDS = 86400 * 30  # 30 days
+# Upper bound on entries per cache; the least recently used series is evicted first.
+MAX_CACHE_ENTRIES = 256
+# Expiry is randomized by +/- this fraction of the TTL so that series loaded
+# together (e.g. the whole FRED tab) don't all go stale on the same refresh.
+CACHE_TTL_JITTER = 0.1
+
+# In-memory LRU caches mapping series_id -> (monotonic expiry, data).
+# Guarded by a lock because summaries are fetched from a thread pool.
+_series_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_info_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
 
 # ASSUMPTION: 3000 observations covers 10+ years of daily data (~2520 trading days)
 # and plenty for weekly (520), monthly (120), or quarterly (40).
 OBSERVATION_LIMIT = 3000
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decodes a FRED JSON response body.
+
+    PERF: orjson (when installed) parses the raw bytes directly, which is much
+    faster than requests' stdlib-based .json() and skips charset detection.
+    Both paths raise a ValueError subclass on malformed JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _cache_get(cache: "OrderedDict[str, Tuple[float, Any]]", key: str) -> Any:
+    """Returns a fresh cached value (marking it recently used), or None."""
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expiry, data = entry
+        if time.monotonic() >= expiry:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return data
+
+
+def _cache_put(
+    cache: "OrderedDict[str, Tuple[float, Any]]", key: str, data: Any, ttl: float
+) -> None:
+    """Stores a value with a jittered TTL, evicting least recently used entries."""
+    expiry = time.monotonic() + ttl * random.uniform(
+        1 - CACHE_TTL_JITTER, 1 + CACHE_TTL_JITTER
+    )
+    with _cache_lock:
+        cache[key] = (expiry, data)
+        cache.move_to_end(key)
+        while len(cache) > MAX_CACHE_ENTRIES:
+            cache.popitem(last=False)
+
+
 def get_series_observations(
     series_id: str, api_key: str, limit: int = OBSERVATION_LIMIT
-) -> Optional[List[Dict[str, Any]]]:
+) -> Optional[List[Tuple[str, str]]]:
     """
     Fetches observations for a specific FRED series.
-    Returns observations in descending order (newest first).
+    Returns (date, value) tuples in descending order (newest first).
+
+    PERF: Only the date and value of each observation are kept; the realtime_*
+    fields FRED also returns are never read, so dropping them at ingestion keeps
+    the cached series ~4x smaller.
     """
     if not api_key:
         logging.error("FRED API key is missing.")
         return None
 
     series_id = series_id.upper()
-    now = datetime.now(timezone.utc)
 
     # Note: We omit limit from cache key for simplicity under the assumption
     # that we always request the same "10-year" optimized amount for a given series.
-    if series_id in _series_cache:
-        timestamp, data = _series_cache[series_id]
-        if (now - timestamp).total_seconds() < CACHE_DURATION_SECONDS:
-            # If cache has enough data, return it
-            if len(data) >= limit:
-                return data
+    cached = _cache_get(_series_cache, series_id)
+    # If cache has enough data, return it
+    if cached is not None and len(cached) >= limit:
+        return cached
 
     try:
         url = f"{BASE_URL}/series/observations"
@@ -46,19 +131,21 @@ def get_series_observations(
             "sort_order": "desc",  # Get latest data first
             "limit": limit,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
 
-        observations = data.get("observations", [])
-        _series_cache[series_id] = (now, observations)
+        observations = [
+            (o["date"], o["value"]) for o in data.get("observations", [])
+        ]
+        _cache_put(_series_cache, series_id, observations, CACHE_DURATION_SECONDS)
         return observations
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logging.error(f"Error fetching FRED series {series_id}: {e}")
         return None
 
 
-def detect_frequency(observations: List[Dict[str, Any]]) -> str:
+def detect_frequency(observations: List[Tuple[str, str]]) -> str:
     """
     Infer frequency from observation dates.
 
@@ -71,8 +158,8 @@ def detect_frequency(observations: List[Dict[str, Any]]) -> str:
     try:
         # Parse the first few dates to determine frequency
         dates = []
-        for obs in observations[:10]:  # Look at first 10 observations
-            date_obj = datetime.strptime(obs["date"], "%Y-%m-%d")
+        for obs_date, _ in observations[:10]:  # Look at first 10 observations
+            date_obj = datetime.fromisoformat(obs_date)
             dates.append(date_obj)
 
         if len(dates) < 2:
@@ -104,7 +191,7 @@ def detect_frequency(observations: List[Dict[str, Any]]) -> str:
 
 
 def compute_enhanced_metrics(
-    observations: List[Dict[str, Any]],
+    observations: List[Tuple[str, str]],
     frequency: str = "M",
     short_months: int = 12,
     long_months: int = 24,
@@ -114,7 +201,7 @@ def compute_enhanced_metrics(
     Compute advanced metrics from observation data.
 
     Args:
-        observations: List of observations in descending order (newest first)
+        observations: List of (date, value) tuples in descending order (newest first)
         frequency: 'M' for monthly, 'Q' for quarterly
         short_months: Lookback for short rolling window (default 12)
         long_months: Lookback for long rolling window (default 24)
@@ -138,8 +225,7 @@ def compute_enhanced_metrics(
 
     # Extract numeric values, converting '.' (FRED's N/A) to NaN
     values = []
-    for obs in observations:
-        val_str = obs["value"]
+    for _, val_str in observations:
         if val_str == ".":
             values.append(np.nan)
         else:
@@ -233,22 +319,25 @@ def get_series_info(series_id: str, api_key: str) -> Optional[Dict[str, Any]]:
     if not api_key:
         return None
 
-    if series_id in _info_cache:
-        return _info_cache[series_id]
+    cached = _cache_get(_info_cache, series_id)
+    if cached is not None:
+        return cached
 
     try:
         url = f"{BASE_URL}/series"
         params = {"series_id": series_id, "api_key": api_key, "file_type": "json"}
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
 
         series_list = data.get("seriess", [])
         if series_list:
-            _info_cache[series_id] = series_list[0]
+            _cache_put(
+                _info_cache, series_id, series_list[0], INFO_CACHE_DURATION_SECONDS
+            )
             return series_list[0]
         return None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logging.error(f"Error fetching FRED series info {series_id}: {e}")
         return None
 
@@ -269,11 +358,11 @@ def search_series(search_text: str, api_key: str) -> List[Dict[str, Any]]:
             "file_type": "json",
             "limit": 20,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _decode_json(response)
         return data.get("seriess", [])
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logging.error(f"Error searching FRED series '{search_text}': {e}")
         return []
 
@@ -363,29 +452,31 @@ def get_series_summary(series_id: str, api_key: str) -> Dict[str, Any]:
 
         # Get current value and date (Obs List is desc, newest first)
         current_obs = obs_list[0]
-        if current_obs["value"] != ".":
-            summary["current"] = float(current_obs["value"])
-            summary["date"] = current_obs["date"]
+        if current_obs[1] != ".":
+            summary["current"] = float(current_obs[1])
+            summary["date"] = current_obs[0]
         else:
             summary["current"] = "N/A"
-            summary["date"] = current_obs["date"]
+            summary["date"] = current_obs[0]
 
         # Previous (1 period)
         if len(obs_list) > 1 and summary["current"] != "N/A":
             prev_obs = obs_list[1]
             try:
-                prev_val = float(prev_obs["value"]) if prev_obs["value"] != "." else 0
+                prev_val = float(prev_obs[1]) if prev_obs[1] != "." else 0
                 summary["change_1p"] = summary["current"] - prev_val
             except (ValueError, TypeError) as e:
                 logging.debug(f"Could not parse previous value for {series_id}: {e}")
 
         # Pre-parse dates to enable fast binary search using bisect.
         # We parse the descending obs_list in reverse order to get an ascending list of dates.
+        # PERF: FRED dates are plain ISO 'YYYY-MM-DD', so datetime.fromisoformat()
+        # is used instead of strptime(), which is dramatically slower per call.
         parsed_dates_asc = []
         valid_obs_asc = []
         for obs in reversed(obs_list):
             try:
-                d = datetime.strptime(obs["date"], "%Y-%m-%d")
+                d = datetime.fromisoformat(obs[0])
                 parsed_dates_asc.append(d)
                 valid_obs_asc.append(obs)
             except ValueError:
@@ -396,7 +487,6 @@ def get_series_summary(series_id: str, api_key: str) -> Dict[str, Any]:
         def find_closest_past(target_date):
             if not parsed_dates_asc:
                 return None
-            import bisect
             # bisect_left locates the insertion point to maintain sorted order
             idx = bisect.bisect_left(parsed_dates_asc, target_date)
             candidates = []
@@ -412,23 +502,28 @@ def get_series_summary(series_id: str, api_key: str) -> Dict[str, Any]:
                 return valid_obs_asc[best_idx]
             return None
 
-        # 1 Year Ago
-        current_date_obj = datetime.strptime(current_obs["date"], "%Y-%m-%d")
-        target_1y = current_date_obj.replace(year=current_date_obj.year - 1)
+        # 1 Year Ago (reuse the already-parsed date of the newest observation)
+        if valid_obs_asc and valid_obs_asc[-1] is current_obs:
+            current_date_obj = parsed_dates_asc[-1]
+        else:
+            current_date_obj = datetime.fromisoformat(current_obs[0])
+        # timedelta subtraction (rather than .replace(year=...)) cannot raise on
+        # Feb 29, and the +/-45 day search window absorbs the leap-day drift.
+        target_1y = current_date_obj - timedelta(days=365)
         obs_1y = find_closest_past(target_1y)
         if obs_1y and summary["current"] != "N/A":
             try:
-                val_1y = float(obs_1y["value"]) if obs_1y["value"] != "." else 0
+                val_1y = float(obs_1y[1]) if obs_1y[1] != "." else 0
                 summary["change_1y"] = summary["current"] - val_1y
             except (ValueError, TypeError) as e:
                 logging.debug(f"Could not parse 1Y ago value for {series_id}: {e}")
 
         # 5 Year Ago
-        target_5y = current_date_obj.replace(year=current_date_obj.year - 5)
+        target_5y = current_date_obj - timedelta(days=365 * 5)
         obs_5y = find_closest_past(target_5y)
         if obs_5y and summary["current"] != "N/A":
             try:
-                val_5y = float(obs_5y["value"]) if obs_5y["value"] != "." else 0
+                val_5y = float(obs_5y[1]) if obs_5y[1] != "." else 0
                 summary["change_5y"] = summary["current"] - val_5y
             except (ValueError, TypeError) as e:
                 logging.debug(f"Could not parse 5Y ago value for {series_id}: {e}")
@@ -447,3 +542,35 @@ def get_series_summary(series_id: str, api_key: str) -> Dict[str, Any]:
     except Exception as e:
         logging.error(f"Error calculating summary for {series_id}: {e}")
         return summary
+
+
+def get_series_summaries(
+    series_ids: List[str], api_key: str, max_workers: int = 4
+) -> List[Dict[str, Any]]:
+    """
+    Calculates summaries for several FRED series concurrently.
+
+    Within one series the observations request depends on the frequency
+    reported by the info request, so those two calls stay sequential; the
+    parallelism is across series, where every request is independent network
+    I/O over the shared Session.
+
+    Returns summaries in the order of `series_ids`, skipping any that failed.
+    """
+    if not series_ids:
+        return []
+
+    summaries: List[Optional[Dict[str, Any]]] = [None] * len(series_ids)
+    with ThreadPoolExecutor(max_workers=min(len(series_ids), max_workers)) as executor:
+        future_to_index = {
+            executor.submit(get_series_summary, series_id, api_key): i
+            for i, series_id in enumerate(series_ids)
+        }
+        for future in as_completed(future_to_index):
+            idx = future_to_index[future]
+            try:
+                summaries[idx] = future.result()
+            except Exception as e:
+                logging.error(f"Failed to fetch FRED series {series_ids[idx]}: {e}")
+
+    return [s for s in summaries if s is not None]
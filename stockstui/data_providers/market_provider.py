@@ -1,19 +1,77 @@
 import yfinance as yf
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+import threading
 import time
 import pandas as pd
 
+# Upper bounds on the in-memory caches. Generous enough for any realistic set
+# of watchlists, but they keep a long-running session from growing without limit.
+MAX_PRICE_CACHE_ENTRIES = 4096
+MAX_NEWS_CACHE_ENTRIES = 256
+
+
+class _BoundedCache(OrderedDict):
+    """
+    A size-capped dict that evicts its least recently *written* entries.
+
+    Writing a key (including via update()) moves it to the end; once the cache
+    holds more than max_entries items the oldest-written ones are dropped. Reads
+    do not reorder entries, so this is write-order (not LRU) eviction.
+
+    Only writes and evictions are serialised by the lock. Since any write may
+    evict another key, readers must use a single .get() rather than an
+    `in` check followed by indexing. Any write (even overwriting an existing
+    key) reorders the dict and invalidates open iterators, so code that needs
+    to iterate while workers may still be writing must use snapshot().
+    """
+
+    def __init__(self, max_entries: int = MAX_PRICE_CACHE_ENTRIES):
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.max_entries:
+                self.popitem(last=False)
+
+    def snapshot(self) -> dict:
+        """Returns a plain-dict copy taken while no write can interleave."""
+        with self._lock:
+            return dict(self)
+
+
 # In-memory cache for storing fetched market data to reduce API calls.
-_price_cache = {}
-_news_cache = {}
-_info_cache = {}
+_price_cache = _BoundedCache(MAX_PRICE_CACHE_ENTRIES)
+_news_cache = _BoundedCache(MAX_NEWS_CACHE_ENTRIES)
+_info_cache = _BoundedCache(MAX_PRICE_CACHE_ENTRIES)
 _market_calendars = {}
 
+# Slow-data fetches currently in progress, keyed by ticker. Lets overlapping
+# refreshes (e.g. two tabs loading the same list) share one yfinance request.
+_inflight_slow: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
 # Duration for which cached news is considered fresh.
 NEWS_CACHE_DURATION_SECONDS = 300  # 5 minutes
 
+# MAPPING: yfinance exchange codes -> pandas_market_calendars calendar names
+EXCHANGE_CALENDAR_MAP = {
+    "NMS": "NYSE",
+    "NYQ": "NYSE",
+    "NYS": "NYSE",
+    "GDAX": "CME_Crypto",
+    "SNP": "NYSE",
+    "DJI": "NYSE",
+    "CBOE": "NYSE",
+    "NIM": "NYSE",
+}
+
 try:
     import pandas_market_calendars as mcal
 except ImportError:
@@ -30,18 +88,7 @@ def _get_calendar(exchange_name: str):
     """
     if exchange_name in _market_calendars:
         return _market_calendars[exchange_name]
-    # MAPPING: yfinance exchange codes -> pandas_market_calendars calendar names
-    exchange_map = {
-        "NMS": "NYSE",
-        "NYQ": "NYSE",
-        "NYS": "NYSE",
-        "GDAX": "CME_Crypto",
-        "SNP": "NYSE",
-        "DJI": "NYSE",
-        "CBOE": "NYSE",
-        "NIM": "NYSE",
-    }
-    calendar_name = exchange_map.get(exchange_name, exchange_name)
+    calendar_name = EXCHANGE_CALENDAR_MAP.get(exchange_name, exchange_name)
     if mcal is None:
         return None
     try:
@@ -87,22 +134,18 @@ def populate_info_cache(initial_data: dict):
 
 
 def get_price_cache_state() -> dict:
-    return _price_cache
+    return _price_cache.snapshot()
 
 
 def get_info_cache_state() -> dict:
-    return _info_cache
+    return _info_cache.snapshot()
 
 
 def get_market_price_data(
     tickers: list[str], force_refresh: bool = False
 ) -> list[dict]:
-    seen = set()
-    valid_tickers = [
-        t.upper()
-        for t in tickers
-        if t and t.upper() not in seen and not seen.add(t.upper())
-    ]
+    # Normalize each symbol once; dict.fromkeys de-duplicates while keeping order.
+    valid_tickers = list(dict.fromkeys(t.upper() for t in tickers if t))
     if not valid_tickers:
         return []
 
@@ -116,11 +159,8 @@ def get_market_price_data(
 
     slow_data_to_fetch, fast_data_to_fetch = [], []
     for ticker in valid_tickers:
-        if (
-            force_refresh
-            or ticker not in _price_cache
-            or now >= _price_cache[ticker].get("expiry", now)
-        ):
+        cached = _price_cache.get(ticker)
+        if force_refresh or cached is None or now >= cached.get("expiry", now):
             slow_data_to_fetch.append(ticker)
 
         info = _info_cache.get(ticker, {})
@@ -141,20 +181,51 @@ def get_market_price_data(
     # This prevents data loss when switching tabs mid-session.
     if live_prices:
         for ticker, fast_data_update in live_prices.items():
-            if ticker in _price_cache and "data" in _price_cache[ticker]:
+            cached = _price_cache.get(ticker)
+            if cached is not None and "data" in cached:
                 # Filter out None values to prevent overwriting valid cached data (fallback)
                 valid_updates = {k: v for k, v in fast_data_update.items() if v is not None}
-                _price_cache[ticker]["data"].update(valid_updates)
+                cached["data"].update(valid_updates)
 
     # Now that the cache is updated, construct the final list from it.
     final_data = []
     for ticker in valid_tickers:
-        if ticker in _price_cache:
-            final_data.append(_price_cache[ticker].get("data", {}))
+        cached = _price_cache.get(ticker)
+        if cached is not None:
+            final_data.append(cached.get("data", {}))
 
     return final_data
 
 
+def _fetch_slow_info(ticker: str) -> tuple[str, dict | None, object | None]:
+    """
+    Fetches info + fast_info for a single ticker, coalescing concurrent requests.
+
+    PERF: If another thread is already fetching this ticker, wait for its result
+    instead of issuing a duplicate yfinance request (single-flight).
+    """
+    with _inflight_lock:
+        future = _inflight_slow.get(ticker)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_slow[ticker] = Future()
+    if not is_owner:
+        return future.result()
+
+    result = (ticker, None, None)
+    try:
+        tkr = yf.Ticker(ticker)
+        result = (ticker, tkr.info, tkr.fast_info)
+    except Exception:
+        logging.warning(f"Failed to fetch slow data for {ticker}")
+    finally:
+        # Always release waiters, even if the fetch was interrupted.
+        with _inflight_lock:
+            _inflight_slow.pop(ticker, None)
+        future.set_result(result)
+    return result
+
+
 def _fetch_and_cache_slow_data(tickers: list[str]):
     """
     Fetches full metadata (info + fast_info) for a batch of tickers in parallel.
@@ -164,8 +235,8 @@ def _fetch_and_cache_slow_data(tickers: list[str]):
     ThreadPoolExecutor, cutting wall-clock time from O(n * latency) to roughly
     O(latency) for typical list sizes.
 
-    Cache writes happen only after all futures complete so the module-level
-    dicts (_price_cache, _info_cache) are never touched from multiple threads.
+    Cache writes happen only after all futures complete, from the calling
+    thread, so the pool workers themselves never touch _price_cache/_info_cache.
 
     PERF: _calculate_info_expiry() is also memoised per exchange within the
     batch — the calendar schedule DataFrame is built once per exchange rather
@@ -174,20 +245,11 @@ def _fetch_and_cache_slow_data(tickers: list[str]):
     if not tickers:
         return
 
-    def _fetch_one(ticker: str) -> tuple[str, dict | None, object | None]:
-        """Fetch info for a single ticker. Runs inside the thread pool."""
-        try:
-            tkr = yf.Ticker(ticker)
-            return ticker, tkr.info, tkr.fast_info
-        except Exception:
-            logging.warning(f"Failed to fetch slow data for {ticker}")
-            return ticker, None, None
-
     # Cap threads to avoid hammering yfinance rate-limits on very large lists.
     max_workers = min(len(tickers), 8)
     raw_results: dict[str, tuple[dict | None, object | None]] = {}
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_ticker = {executor.submit(_fetch_one, t): t for t in tickers}
+        future_to_ticker = {executor.submit(_fetch_slow_info, t): t for t in tickers}
         for future in as_completed(future_to_ticker):
             ticker, slow_info, fast_info = future.result()
             raw_results[ticker] = (slow_info, fast_info)
@@ -244,9 +306,13 @@ def _fetch_and_cache_slow_data(tickers: list[str]):
                     },
                 }
             else:
-                # If slow_info is None, it means _fetch_one caught an exception (fetch failed).
+                # If slow_info is None, it means _fetch_slow_info caught an exception (fetch failed).
                 # If slow_info is a dict but has no currency, it's an invalid ticker.
                 description = "Data Unavailable" if slow_info is None else "Invalid Ticker"
+                if slow_info is not None:
+                    # Record the negative lookup the same way get_ticker_info() does,
+                    # so history/news requests don't re-fetch .info for this ticker.
+                    _info_cache[ticker] = {}
                 _price_cache[ticker] = {
                     "expiry": datetime.now(timezone.utc) + timedelta(days=1),
                     "data": {"symbol": ticker, "description": description},
@@ -333,20 +399,22 @@ def _fetch_fast_data(tickers: list[str]) -> dict:
 
 
 def get_ticker_info(ticker: str) -> dict | None:
-    if ticker in _info_cache:
-        return _info_cache[ticker]
+    cached = _info_cache.get(ticker)
+    if cached is not None:
+        return cached
     try:
         info = yf.Ticker(ticker).info
         if not info or not info.get("currency"):
             _info_cache[ticker] = {}
             return None
-        _info_cache[ticker] = {
+        ticker_info = {
             "currency": info.get("currency"),
             "exchange": info.get("exchange"),
             "shortName": info.get("shortName"),
             "longName": info.get("longName"),
         }
-        return _info_cache[ticker]
+        _info_cache[ticker] = ticker_info
+        return ticker_info
     except Exception:
         _info_cache[ticker] = {}
         return None
@@ -473,9 +541,34 @@ def get_historical_data(ticker: str, period: str, interval: str = "1d"):
 
 
 def get_news_for_tickers(tickers: list[str]) -> list[dict] | None:
+    """
+    Fetches and merges news for several tickers, de-duplicated by link.
+
+    PERF: get_news_data() is single-ticker and blocks on up to two HTTP
+    round-trips (info + news), so the per-ticker calls are fanned out over a
+    ThreadPoolExecutor. Each worker only touches its own ticker's cache keys,
+    and results are merged afterwards in the original ticker order so the
+    de-duplication stays deterministic.
+    """
     all_news, seen_urls = [], set()
-    for ticker in tickers:
-        news_items = get_news_data(ticker)
+    unique_tickers = list(dict.fromkeys(t for t in tickers if t))
+    results: dict[str, list[dict] | None] = {}
+    if unique_tickers:
+        max_workers = min(len(unique_tickers), 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_ticker = {
+                executor.submit(get_news_data, t): t for t in unique_tickers
+            }
+            for future in as_completed(future_to_ticker):
+                ticker = future_to_ticker[future]
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    logging.warning(f"Failed to fetch news for {ticker}: {e}")
+                    results[ticker] = None
+
+    for ticker in unique_tickers:
+        news_items = results.get(ticker)
         if news_items:
             for item in news_items:
                 if (link := item.get("link")) and link not in seen_urls:
@@ -492,8 +585,9 @@ def get_news_data(ticker: str) -> list[dict] | None:
         return []
     normalized_ticker = ticker.upper()
     now = datetime.now(timezone.utc)
-    if normalized_ticker in _news_cache:
-        timestamp, cached_data = _news_cache[normalized_ticker]
+    cached = _news_cache.get(normalized_ticker)
+    if cached is not None:
+        timestamp, cached_data = cached
         if (now - timestamp).total_seconds() < NEWS_CACHE_DURATION_SECONDS:
             return cached_data
     info = get_ticker_info(ticker)
@@ -6,6 +6,7 @@ import logging
 import time
 import yfinance as yf
 import datetime
+import pandas as pd
 from stockstui.utils import black_scholes
 
 
@@ -133,8 +134,6 @@ def _calculate_greeks_for_chain(chain_df, underlying_price, expiration_date, fla
 
     # Add columns to DataFrame
     if greeks_list:
-        import pandas as pd
-
         greeks_df = pd.DataFrame(greeks_list)
         # Concatenate original df with greeks
         # Reset index to ensure alignment
@@ -84,6 +84,10 @@ from stockstui.database.db_manager import DbManager
 from stockstui.parser import create_arg_parser
 from stockstui.log_handler import TextualHandler
 
+# Strips currency symbols and other non-numeric prefixes from table cell text
+# before numeric sorting. Compiled once since sort keys run for every row.
+NUMERIC_PREFIX_RE = re.compile(r"^[^\d\.\-]+")
+
 
 # A base template for all themes. It defines the required keys and uses
 # placeholder variables (e.g., '$blue') that will be substituted with
@@ -1960,8 +1964,8 @@ class StocksTUI(App):
                     dt.add_row(item["_section"], item.get("id", "N/A"))
                     if "observations" in item:
                         obs_list = item["observations"]
-                        for obs in obs_list:
-                            dt.add_row(f"  {obs['date']}", f"  {obs['value']}")
+                        for obs_date, obs_value in obs_list:
+                            dt.add_row(f"  {obs_date}", f"  {obs_value}")
                     elif "info" in item and item["info"]:
                         info = item["info"]
                         for key, value in info.items():
@@ -2005,7 +2009,7 @@ class StocksTUI(App):
                     return (1, 0)
                 if self._sort_column_key in ("Description", "Ticker"):
                     return (0, text_content.lower())
-                cleaned_text = re.sub(r"^[^\d\.\-]+", "", text_content)
+                cleaned_text = NUMERIC_PREFIX_RE.sub("", text_content)
                 cleaned_text = (
                     cleaned_text.replace(",", "")
                     .replace("%", "")
@@ -2045,7 +2049,7 @@ class StocksTUI(App):
                         return (0, text_content)
                     except (ValueError, TypeError):
                         return (1, "")
-                cleaned_text = re.sub(r"^[^\d\.\-]+", "", text_content).replace(",", "")
+                cleaned_text = NUMERIC_PREFIX_RE.sub("", text_content).replace(",", "")
                 try:
                     return (0, float(cleaned_text))
                 except (ValueError, TypeError):
@@ -2862,10 +2866,9 @@ def run_cli_output(args: argparse.Namespace):
 
             if series_list:
                 with console.status("[bold green]Fetching FRED data...[/]"):
-                    fred_data = []
-                    for sid in series_list:
-                        s = fred_provider.get_series_summary(sid, api_key)
-                        fred_data.append(s)
+                    fred_data = fred_provider.get_series_summaries(
+                        series_list, api_key
+                    )
 
                 # Use same header style as Ticker table for consistency
                 fred_table = Table(
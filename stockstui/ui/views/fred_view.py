@@ -7,7 +7,6 @@ from textual import work
 from rich.text import Text
 import webbrowser
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from stockstui.data_providers import fred_provider
 from stockstui.ui.widgets.navigable_data_table import NavigableDataTable
@@ -174,22 +173,7 @@ class FredView(Vertical):
         self.app.call_from_thread(self._set_loading, True)
 
         # Fetch FRED series summaries concurrently to avoid O(n * latency) blocking
-        max_workers = min(len(series_list), 4)
-        summaries = [None] * len(series_list)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(fred_provider.get_series_summary, series_id, api_key): i
-                for i, series_id in enumerate(series_list)
-            }
-            for future in as_completed(future_to_index):
-                idx = future_to_index[future]
-                try:
-                    summaries[idx] = future.result()
-                except Exception as e:
-                    logging.error(f"Failed to fetch FRED series: {e}")
-
-        # Filter out any None values in case of fetch errors
-        summaries = [s for s in summaries if s is not None]
+        summaries = fred_provider.get_series_summaries(series_list, api_key)
 
         self.app.call_from_thread(self._populate_table, summaries)
 
@@ -10,6 +10,9 @@ from textual.app import ComposeResult, on
 
 from stockstui.ui.suggesters import TickerSuggester
 
+# Matches markdown links, capturing the link text and the URL.
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]*)\)")
+
 
 class NewsView(Vertical):
     """A view for displaying news articles for a selected ticker, with link navigation."""
@@ -118,7 +121,6 @@ class NewsView(Vertical):
             markdown_widget.update(self._original_markdown)
             return
 
-        link_pattern = re.compile(r"\[([^\]]*)\]\(([^)]*)\)")
         link_counter = 0
 
         def replacer(match):
@@ -135,7 +137,7 @@ class NewsView(Vertical):
             link_counter += 1
             return replacement
 
-        new_content = link_pattern.sub(replacer, self._original_markdown)
+        new_content = MARKDOWN_LINK_RE.sub(replacer, self._original_markdown)
         markdown_widget.update(new_content)
 
         if self._link_urls and len(self._link_urls) > 1:
@@ -1,6 +1,20 @@
 import pandas as pd
 from textual_plotext import PlotextPlot
 
+# Axis label suffixes, largest first. The first threshold that fits wins.
+_LARGE_NUM_SUFFIXES = ((1_000_000, "M"), (1_000, "K"))
+
+
+def format_large_num(n) -> str:
+    """Formats an axis value compactly, e.g. 1500 -> '1.5K', 2000000 -> '2M'."""
+    if n == 0:
+        return "0"
+    for threshold, suffix in _LARGE_NUM_SUFFIXES:
+        if n >= threshold:
+            val = n / threshold
+            return f"{int(val)}{suffix}" if float(val).is_integer() else f"{val:.1f}{suffix}"
+    return str(int(n))
+
 
 class OIChart(PlotextPlot):
     """A custom widget to display Open Interest by strike using plotext."""
@@ -200,21 +214,6 @@ class OIChart(PlotextPlot):
                 ticks.append(current)
                 current += step
 
-            def format_large_num(n):
-                if n == 0:
-                    return "0"
-                if n >= 1_000_000:
-                    val = n / 1_000_000
-                    return (
-                        f"{int(val)}M" if float(val).is_integer() else f"{val:.1f}M"
-                    )
-                if n >= 1_000:
-                    val = n / 1_000
-                    return (
-                        f"{int(val)}K" if float(val).is_integer() else f"{val:.1f}K"
-                    )
-                return str(int(n))
-
             plt.yticks(ticks, [format_large_num(t) for t in ticks])
 
         plt.grid(True, True)
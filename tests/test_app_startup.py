@@ -1,26 +1,44 @@
 import unittest
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from stockstui import config_manager
 from stockstui.main import StocksTUI
 from tests.test_utils import TEST_APP_ROOT
 from stockstui.config_manager import ConfigManager
 
 
 class TestAppStartup(unittest.IsolatedAsyncioTestCase):
-    def setUp(self):
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.user_config_dir = Path(self.tmpdir.name)
+    @classmethod
+    def setUpClass(cls):
+        cls._root_tmp = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._root_tmp.cleanup()
 
-    def tearDown(self):
-        self.tmpdir.cleanup()
+    def setUp(self):
+        # Each test still gets its own config and cache directories inside the
+        # shared root, so no state leaks between tests.
+        test_root = Path(self._root_tmp.name) / self._testMethodName
+        self.user_config_dir = test_root / "config"
+        self.user_cache_dir = test_root / "cache"
 
     def _setup_test_app(self, cli_overrides=None):
-        app = StocksTUI(cli_overrides=cli_overrides or {})
-        mock_dirs = patch("stockstui.config_manager.PlatformDirs").start()
-        mock_dirs.return_value.user_config_dir = str(self.user_config_dir)
-        app.config = ConfigManager(app_root=TEST_APP_ROOT.parent)
+        # ConfigManager reads the module-level `dirs` (built at import time), and
+        # StocksTUI.__init__ already creates its config, DB and portfolio managers,
+        # so the patch must cover the app's construction as well.
+        test_dirs = MagicMock(
+            user_config_dir=str(self.user_config_dir),
+            user_cache_dir=str(self.user_cache_dir),
+        )
+        with patch.object(config_manager, "dirs", test_dirs):
+            app = StocksTUI(cli_overrides=cli_overrides or {})
+            app.config = ConfigManager(app_root=TEST_APP_ROOT.parent)
+        self.assertEqual(app.config.user_config_dir, self.user_config_dir)
+        self.assertTrue((self.user_config_dir / "settings.json").exists())
+        self.assertTrue((self.user_cache_dir / "app_cache.db").exists())
         app._load_and_register_themes()
 
         # Initialize session lists if provided - convert strings to dict format
@@ -28,7 +46,6 @@ class TestAppStartup(unittest.IsolatedAsyncioTestCase):
             for list_name, tickers in cli_overrides["session_list"].items():
                 app.config.lists[list_name] = [{"ticker": ticker} for ticker in tickers]
 
-        patch.stopall()
         return app
 
     async def test_startup_with_news_ticker_override(self):
@@ -2,8 +2,12 @@ import unittest
 import tempfile
 import json
 from pathlib import Path
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 
+import numpy as np
+
+from stockstui.database import db_manager
 from stockstui.database.db_manager import (
     DbManager,
     CACHE_LOAD_DURATION_SECONDS,
@@ -36,6 +40,13 @@ class TestDbManager(unittest.TestCase):
         self.assertIn("price_cache", tables)
         self.assertIn("ticker_info", tables)
 
+    def test_connection_uses_wal_journal(self):
+        """Verify the connection is opened in WAL mode with relaxed syncing."""
+        cursor = self.dbm.conn.cursor()
+        self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        # synchronous=NORMAL is reported as 1
+        self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)
+
     def test_save_and_load_price_cache(self):
         """Test the full cycle of saving and loading the price cache."""
         now = datetime.now(timezone.utc)
@@ -55,6 +66,35 @@ class TestDbManager(unittest.TestCase):
             loaded_data["AAPL"]["expiry"].timestamp(), now.timestamp(), places=5
         )
 
+    def test_save_and_load_price_cache_without_orjson(self):
+        """Test that the cache round-trips with the stdlib json fallback."""
+        now = datetime.now(timezone.utc)
+        sample_data = {"AAPL": {"expiry": now, "data": {"price": 150.0, "symbol": "AAPL"}}}
+
+        with patch("stockstui.database.db_manager.orjson", None):
+            self.dbm.save_price_cache_to_db(sample_data)
+            loaded_data = self.dbm.load_price_cache_from_db()
+
+        self.assertEqual(loaded_data["AAPL"]["data"], {"price": 150.0, "symbol": "AAPL"})
+
+    def test_price_cache_nan_round_trips_as_none(self):
+        """Test that NaN and numpy values reload identically with and without orjson."""
+        now = datetime.now(timezone.utc)
+        data = {"price": float("nan"), "volume": np.int64(1100), "high": np.float64("nan")}
+        expected = {"price": None, "volume": 1100, "high": None}
+
+        for use_orjson in (True, False):
+            with self.subTest(orjson=use_orjson):
+                if use_orjson and db_manager.orjson is None:
+                    self.skipTest("orjson is not installed")
+                orjson_module = db_manager.orjson if use_orjson else None
+                with patch("stockstui.database.db_manager.orjson", orjson_module):
+                    self.dbm.save_price_cache_to_db(
+                        {"AAPL": {"expiry": now, "data": data}}
+                    )
+                    loaded_data = self.dbm.load_price_cache_from_db()
+                self.assertEqual(loaded_data["AAPL"]["data"], expected)
+
     def test_load_price_cache_filters_stale_data(self):
         """Test that load_price_cache_from_db filters out entries older than CACHE_LOAD_DURATION."""
         stale_ts = (
@@ -134,6 +174,15 @@ class TestDbManager(unittest.TestCase):
 
         self.assertEqual(loaded_data, sample_data)
 
+    def test_negative_info_entries_are_not_persisted(self):
+        """Test that invalid-ticker markers ({}) don't reload as valid-looking info."""
+        self.dbm.save_info_cache_to_db(
+            {"BADX": {}, "TSLA": {"exchange": "NMS", "currency": "USD"}}
+        )
+        loaded_data = self.dbm.load_info_cache_from_db()
+        self.assertNotIn("BADX", loaded_data)
+        self.assertIn("TSLA", loaded_data)
+
 
 if __name__ == "__main__":
     unittest.main()
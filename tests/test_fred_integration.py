@@ -1,15 +1,28 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch, call
-from stockstui.data_providers.fred_provider import get_series_summary, BASE_URL
+from stockstui.data_providers import fred_provider
+from stockstui.data_providers.fred_provider import (
+    get_series_summary,
+    get_series_summaries,
+    BASE_URL,
+)
+
+
+def _json_response(payload):
+    """Builds a mock response exposing the payload via both .content and .json()."""
+    response = MagicMock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    return response
 
 
 class TestFredIntegration(unittest.TestCase):
-    @patch("stockstui.data_providers.fred_provider.requests.get")
+    @patch("stockstui.data_providers.fred_provider._session.get")
     def test_get_series_summary(self, mock_get):
         # Mock Observations Response
-        mock_response_obs = MagicMock()
-        mock_response_obs.status_code = 200
-        mock_response_obs.json.return_value = {
+        mock_response_obs = _json_response({
             "observations": [
                 {"date": "2023-01-01", "value": "105.0"},  # Current
                 {"date": "2022-12-01", "value": "104.0"},  # Prev
@@ -18,14 +31,12 @@ class TestFredIntegration(unittest.TestCase):
                 # Gap
                 {"date": "2018-01-01", "value": "90.0"},  # 5Y Ago
             ]
-        }
+        })
 
         # Mock Info Response
-        mock_response_info = MagicMock()
-        mock_response_info.status_code = 200
-        mock_response_info.json.return_value = {
+        mock_response_info = _json_response({
             "seriess": [{"title": "Test Series", "units": "Index"}]
-        }
+        })
 
         # Side effect to return different responses based on URL
         def side_effect(url, params, timeout):
@@ -56,20 +67,16 @@ class TestFredIntegration(unittest.TestCase):
         self.assertIn("id", summary)
         self.assertEqual(summary["id"], "TEST")
 
-    @patch("stockstui.data_providers.fred_provider.requests.get")
+    @patch("stockstui.data_providers.fred_provider._session.get")
     def test_get_series_summary_nans(self, mock_get):
         # Mock Observations Response with dots (Fred's N/A)
-        mock_response_obs = MagicMock()
-        mock_response_obs.status_code = 200
-        mock_response_obs.json.return_value = {
+        mock_response_obs = _json_response({
             "observations": [
                 {"date": "2023-01-01", "value": "."},  # Invalid
             ]
-        }
+        })
 
-        mock_response_info = MagicMock()
-        mock_response_info.status_code = 200
-        mock_response_info.json.return_value = {"seriess": []}
+        mock_response_info = _json_response({"seriess": []})
 
         mock_get.side_effect = (
             lambda url, params, timeout: mock_response_obs
@@ -87,7 +94,7 @@ class TestFredIntegration(unittest.TestCase):
         self.assertEqual(summary["change_1y"], "N/A")
         self.assertEqual(summary["change_5y"], "N/A")
 
-    @patch("stockstui.data_providers.fred_provider.requests.get")
+    @patch("stockstui.data_providers.fred_provider._session.get")
     def test_get_series_summary_missing_api_key(self, mock_get):
         """Test behavior when API key is missing."""
         # The function returns a dict with N/A values when API key is missing
@@ -104,3 +111,110 @@ class TestFredIntegration(unittest.TestCase):
         summary = get_series_summary("TEST", "fake_key")
         self.assertIsNotNone(summary)
         self.assertEqual(summary["current"], "N/A")
+
+    @patch("stockstui.data_providers.fred_provider._session.get")
+    def test_get_series_observations_keeps_date_and_value(self, mock_get):
+        """Test that cached observations are trimmed to (date, value) tuples."""
+        fred_provider._series_cache.clear()
+        mock_get.return_value = _json_response({
+            "observations": [
+                {
+                    "realtime_start": "2023-02-01",
+                    "realtime_end": "2023-02-01",
+                    "date": "2023-01-01",
+                    "value": "105.0",
+                },
+            ]
+        })
+
+        observations = fred_provider.get_series_observations("TRIM", "fake_key", limit=1)
+
+        self.assertEqual(observations, [("2023-01-01", "105.0")])
+
+    @patch("stockstui.data_providers.fred_provider._session.get")
+    def test_get_series_info_malformed_json(self, mock_get):
+        """Test that an undecodable body is treated like a failed request."""
+        response = MagicMock()
+        response.content = b"<html>not json</html>"
+        response.json.side_effect = ValueError("not json")
+        mock_get.return_value = response
+
+        self.assertIsNone(fred_provider.get_series_info("MALFORMED", "fake_key"))
+
+    @patch("stockstui.data_providers.fred_provider.get_series_summary")
+    def test_get_series_summaries_preserves_order(self, mock_summary):
+        """Test that concurrent summaries come back in input order, skipping failures."""
+
+        def side_effect(series_id, api_key):
+            if series_id == "BAD":
+                raise ValueError("boom")
+            return {"id": series_id}
+
+        mock_summary.side_effect = side_effect
+
+        summaries = get_series_summaries(["A", "BAD", "B", "C"], "fake_key")
+
+        self.assertEqual([s["id"] for s in summaries], ["A", "B", "C"])
+        self.assertEqual(get_series_summaries([], "fake_key"), [])
+
+    @patch("stockstui.data_providers.fred_provider.get_series_info")
+    @patch("stockstui.data_providers.fred_provider.get_series_observations")
+    def test_get_series_summary_picks_nearest_past_observation(self, mock_obs, mock_info):
+        """Test that the 1Y comparison uses the closest observation, not the first in range."""
+        mock_info.return_value = {"title": "Weekly", "frequency": "Weekly"}
+        mock_obs.return_value = [
+            ("2023-01-07", "110.0"),  # Current
+            ("2022-01-15", "101.0"),  # 8 days after 1Y target
+            ("2022-01-08", "100.0"),  # 1 day after 1Y target
+            ("2021-12-25", "99.0"),  # 13 days before 1Y target
+        ]
+
+        summary = get_series_summary("NEAREST", "fake_key")
+
+        self.assertEqual(summary["change_1y"], 10.0)  # 110 - 100
+
+    @patch("stockstui.data_providers.fred_provider.get_series_info")
+    @patch("stockstui.data_providers.fred_provider.get_series_observations")
+    def test_get_series_summary_leap_day(self, mock_obs, mock_info):
+        """Test that a Feb 29 current date still yields 1Y and 5Y changes."""
+        mock_info.return_value = {"title": "Leap", "frequency": "Monthly"}
+        mock_obs.return_value = [
+            ("2024-02-29", "110.0"),  # Current
+            ("2023-03-01", "100.0"),  # 1Y Ago
+            ("2019-03-01", "90.0"),  # 5Y Ago
+        ]
+
+        summary = get_series_summary("LEAP", "fake_key")
+
+        self.assertEqual(summary["change_1y"], 10.0)
+        self.assertEqual(summary["change_5y"], 20.0)
+
+
+class TestFredCache(unittest.TestCase):
+    """Tests for the bounded, expiring FRED in-memory caches."""
+
+    def setUp(self):
+        fred_provider._series_cache.clear()
+        fred_provider._info_cache.clear()
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = fred_provider._series_cache
+        with patch.object(fred_provider, "MAX_CACHE_ENTRIES", 2):
+            fred_provider._cache_put(cache, "A", [1], 300)
+            fred_provider._cache_put(cache, "B", [2], 300)
+            fred_provider._cache_get(cache, "A")  # A becomes most recently used
+            fred_provider._cache_put(cache, "C", [3], 300)
+
+        self.assertEqual(list(cache), ["A", "C"])
+
+    def test_cache_entry_expires(self):
+        cache = fred_provider._info_cache
+        with patch("stockstui.data_providers.fred_provider.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            fred_provider._cache_put(cache, "A", {"title": "A"}, 100)
+            self.assertEqual(fred_provider._cache_get(cache, "A"), {"title": "A"})
+
+            # Beyond the maximum jittered TTL the entry is dropped.
+            mock_time.return_value = 1000.0 + 100 * (1 + fred_provider.CACHE_TTL_JITTER)
+            self.assertIsNone(fred_provider._cache_get(cache, "A"))
+            self.assertNotIn("A", cache)
@@ -1,4 +1,6 @@
+import threading
 import unittest
+from concurrent.futures import Future
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone, timedelta
 import pandas as pd
@@ -6,41 +8,63 @@ import pytz
 
 from stockstui.data_providers import market_provider
 
+# Module-level caches in market_provider that every test gets a fresh copy of.
+_CACHE_NAMES = ("_price_cache", "_info_cache", "_news_cache", "_market_calendars")
+
+
+def _make_ticker_mock(price, previous_close, exchange="NYSE", **info):
+    """Builds a yf.Ticker stand-in with the given fast price and .info fields."""
+    ticker = MagicMock()
+    ticker.info = {
+        "regularMarketPreviousClose": previous_close,
+        "currency": "USD",
+        "exchange": exchange,
+        **info,
+    }
+    ticker.fast_info = {"lastPrice": price}
+    return ticker
+
 
 class TestMarketProvider(unittest.TestCase):
     """
     Unit tests for the market_provider module.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch the yfinance entry points once for the whole class."""
+        targets = (("mock_yf_ticker", "Ticker"), ("mock_yf_download", "download"))
+        for attr, name in targets:
+            patcher = patch(f"stockstui.data_providers.market_provider.yf.{name}")
+            setattr(cls, attr, patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
-        """Reset the internal caches before each test."""
-        market_provider._price_cache.clear()
-        market_provider._info_cache.clear()
-        market_provider._news_cache.clear()
-        market_provider._market_calendars.clear()
-
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
-    def test_get_market_price_data_fetches_uncached(self, mock_yf_ticker):
+        """Give each test its own empty caches and freshly reset yfinance mocks."""
+        self.mock_yf_ticker.reset_mock(return_value=True, side_effect=True)
+        self.mock_yf_download.reset_mock(return_value=True, side_effect=True)
+        for name in _CACHE_NAMES:
+            original = getattr(market_provider, name)
+            if isinstance(original, market_provider._BoundedCache):
+                # Keep each cache's own bound (e.g. the smaller news cache).
+                fresh = market_provider._BoundedCache(original.max_entries)
+            else:
+                fresh = type(original)()
+            patcher = patch.object(market_provider, name, fresh)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_get_market_price_data_fetches_uncached(self):
         """Test that data is fetched for tickers not present in the cache."""
-        mock_ticker_obj = MagicMock()
-        mock_ticker_obj.info = {
-            "currency": "USD",
-            "longName": "Apple Inc.",
-            "exchange": "NMS",
-            "regularMarketPreviousClose": 150.0,
-        }
-        mock_ticker_obj.fast_info = {"lastPrice": 155.0}
-        mock_yf_ticker.return_value = mock_ticker_obj
+        self.mock_yf_ticker.return_value = _make_ticker_mock(
+            155.0, 150.0, exchange="NMS", longName="Apple Inc."
+        )
 
         data = market_provider.get_market_price_data(["AAPL"])
         self.assertEqual(data[0]["symbol"], "AAPL")
 
-    @patch("stockstui.data_providers.market_provider.yf.download")
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
     @patch("stockstui.data_providers.market_provider.get_market_status")
-    def test_get_market_price_data_uses_cache(
-        self, mock_market_status, mock_yf_ticker, mock_yf_download
-    ):
+    def test_get_market_price_data_uses_cache(self, mock_market_status):
         """Test that fresh, cached data is used instead of making an API call."""
         now = datetime.now(timezone.utc)
         market_provider._price_cache["GOOG"] = {
@@ -49,39 +73,105 @@ class TestMarketProvider(unittest.TestCase):
         }
         mock_market_status.return_value = {"is_open": False}
         market_provider.get_market_price_data(["GOOG"])
-        mock_yf_ticker.assert_not_called()
-        mock_yf_download.assert_not_called()
+        self.mock_yf_ticker.assert_not_called()
+        self.mock_yf_download.assert_not_called()
 
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
-    def test_fetch_slow_data_handles_exception(self, mock_yf_ticker):
+    def test_fetch_slow_data_handles_exception(self):
         """Test graceful failure when fetching slow data fails."""
-        mock_yf_ticker.side_effect = Exception("API Error")
+        self.mock_yf_ticker.side_effect = Exception("API Error")
         market_provider._fetch_and_cache_slow_data(["FAIL"])
         self.assertEqual(
             market_provider._price_cache["FAIL"]["data"]["description"],
             "Data Unavailable",
         )
 
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
-    def test_get_ticker_info_handles_exception(self, mock_yf_ticker):
+    def test_invalid_ticker_info_is_not_refetched(self):
+        """Test that an invalid ticker found by the slow fetch is not re-queried for info."""
+        self.mock_yf_ticker.return_value.info = {"longName": "No currency"}
+        market_provider._fetch_and_cache_slow_data(["BAD"])
+        self.assertEqual(
+            market_provider._price_cache["BAD"]["data"]["description"],
+            "Invalid Ticker",
+        )
+        self.mock_yf_ticker.reset_mock()
+        self.assertFalse(market_provider.get_ticker_info("BAD"))
+        self.mock_yf_ticker.assert_not_called()
+
+    def test_unpersisted_invalid_ticker_is_refetched(self):
+        """Test that an invalid ticker missing from the reloaded cache is re-queried."""
+        # The DB drops {} markers, so only valid entries come back on startup.
+        market_provider.populate_info_cache({"TSLA": {"exchange": "NMS", "currency": "USD"}})
+        self.mock_yf_ticker.return_value.info = {"longName": "No currency"}
+        self.assertIsNone(market_provider.get_ticker_info("BADX"))
+        self.mock_yf_ticker.assert_called_once_with("BADX")
+
+    def test_price_cache_evicts_oldest_entries(self):
+        """Test that the price cache drops its least recently written tickers."""
+        market_provider._price_cache.max_entries = 2
+        market_provider.populate_price_cache({"A": {}, "B": {}, "C": {}})
+        self.assertEqual(list(market_provider._price_cache), ["B", "C"])
+
+        market_provider._price_cache["B"] = {}  # B becomes most recently written
+        market_provider._price_cache["D"] = {}
+        self.assertEqual(list(market_provider._price_cache), ["B", "D"])
+
+    def test_cache_state_is_a_snapshot(self):
+        """Test that the persisted cache state is unaffected by later writes."""
+        market_provider._price_cache["AAPL"] = {"data": {"price": 1.0}}
+        state = market_provider.get_price_cache_state()
+        for _ in state:
+            market_provider._price_cache["AAPL"] = {"data": {"price": 2.0}}
+        self.assertEqual(state, {"AAPL": {"data": {"price": 1.0}}})
+
+    def test_get_ticker_info_returns_entry_even_if_evicted(self):
+        """Test that a freshly fetched info dict is returned even if evicted at once."""
+        market_provider._info_cache.max_entries = 0
+        self.mock_yf_ticker.return_value.info = {"currency": "USD", "exchange": "NMS"}
+        info = market_provider.get_ticker_info("AAPL")
+        self.assertEqual(info["exchange"], "NMS")
+
+    def test_slow_fetch_joins_inflight_request(self):
+        """Test that a ticker already being fetched is not requested a second time."""
+        pending = Future()
+        result = {}
+        with patch.dict(market_provider._inflight_slow, {"AAPL": pending}):
+            waiter = threading.Thread(
+                target=lambda: result.update(
+                    value=market_provider._fetch_slow_info("AAPL")
+                )
+            )
+            waiter.start()
+            pending.set_result(("AAPL", {"currency": "USD"}, {}))
+            waiter.join(timeout=5)
+
+        self.assertEqual(result["value"], ("AAPL", {"currency": "USD"}, {}))
+        self.mock_yf_ticker.assert_not_called()
+
+    def test_slow_fetch_clears_inflight_entry(self):
+        """Test that the in-flight registry is emptied once a fetch finishes."""
+        self.mock_yf_ticker.side_effect = Exception("API Error")
+        self.assertEqual(
+            market_provider._fetch_slow_info("FAIL"), ("FAIL", None, None)
+        )
+        self.assertNotIn("FAIL", market_provider._inflight_slow)
+
+    def test_get_ticker_info_handles_exception(self):
         """Test graceful failure when get_ticker_info fails."""
-        mock_yf_ticker.return_value.info = {}
+        self.mock_yf_ticker.return_value.info = {}
         self.assertIsNone(market_provider.get_ticker_info("BAD"))
-        mock_yf_ticker.side_effect = Exception("API Error")
+        self.mock_yf_ticker.side_effect = Exception("API Error")
         self.assertIsNone(market_provider.get_ticker_info("ERROR"))
 
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
-    def test_get_news_for_invalid_ticker(self, mock_yf_ticker):
+    def test_get_news_for_invalid_ticker(self):
         """Test that get_news returns None for an invalid ticker."""
-        mock_yf_ticker.return_value.info = {}
+        self.mock_yf_ticker.return_value.info = {}
         self.assertIsNone(market_provider.get_news_data("INVALID"))
 
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
-    def test_get_news_data_handles_malformed_items(self, mock_yf_ticker):
+    def test_get_news_data_handles_malformed_items(self):
         """Test that news parsing is resilient to missing data fields."""
-        mock_yf_ticker.return_value.info = {"currency": "USD"}
+        self.mock_yf_ticker.return_value.info = {"currency": "USD"}
         # This item is missing 'summary', 'provider', and 'canonicalUrl'
-        mock_yf_ticker.return_value.news = [
+        self.mock_yf_ticker.return_value.news = [
             {"content": {"title": "Test News", "pubDate": "2025-08-19T12:00:00.000Z"}}
         ]
 
@@ -95,13 +185,31 @@ class TestMarketProvider(unittest.TestCase):
         self.assertEqual(item["publisher"], "N/A")
         self.assertEqual(item["link"], "#")
 
-    @patch("stockstui.data_providers.market_provider.yf.download")
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
+    @patch("stockstui.data_providers.market_provider.get_news_data")
+    def test_get_news_for_tickers_merges_and_dedupes(self, mock_get_news):
+        """Test that news for several tickers is merged, de-duplicated and sorted."""
+        t1 = datetime(2025, 8, 18, tzinfo=timezone.utc)
+        t2 = datetime(2025, 8, 19, tzinfo=timezone.utc)
+        news_by_ticker = {
+            "AAPL": [{"link": "a", "publish_datetime_utc": t1}],
+            "MSFT": [
+                {"link": "a", "publish_datetime_utc": t1},
+                {"link": "b", "publish_datetime_utc": t2},
+            ],
+            "FAIL": None,
+        }
+        mock_get_news.side_effect = lambda t: news_by_ticker[t]
+
+        news = market_provider.get_news_for_tickers(["AAPL", "MSFT", "FAIL", "AAPL"])
+
+        self.assertEqual([item["link"] for item in news], ["b", "a"])
+        self.assertEqual(mock_get_news.call_count, 3)
+
     @patch("stockstui.data_providers.market_provider.datetime")
     @patch("stockstui.data_providers.market_provider.pd.Timestamp.now")
     @patch("stockstui.data_providers.market_provider.mcal.get_calendar")
     def test_cache_invalidated_after_market_open(
-        self, mock_get_calendar, mock_pd_now, mock_dt, mock_yf_ticker, mock_yf_download
+        self, mock_get_calendar, mock_pd_now, mock_dt
     ):
         """
         Test that the price cache is correctly invalidated after a new market session opens.
@@ -132,14 +240,7 @@ class TestMarketProvider(unittest.TestCase):
         mock_dt.now.return_value = day1_noon_utc
         mock_pd_now.return_value = day1_noon_ny
 
-        mock_ticker_obj1 = MagicMock()
-        mock_ticker_obj1.info = {
-            "regularMarketPreviousClose": 100.0,
-            "currency": "USD",
-            "exchange": "NYSE",
-        }
-        mock_ticker_obj1.fast_info = {"lastPrice": 105.0}
-        mock_yf_ticker.return_value = mock_ticker_obj1
+        self.mock_yf_ticker.return_value = _make_ticker_mock(105.0, 100.0)
 
         # Mock download for fast data
         mock_df1 = pd.DataFrame(
@@ -147,12 +248,12 @@ class TestMarketProvider(unittest.TestCase):
             index=[day1_noon_ny]
         )
         mock_df1.columns = pd.MultiIndex.from_tuples(mock_df1.columns)
-        mock_yf_download.return_value = mock_df1
+        self.mock_yf_download.return_value = mock_df1
 
         market_provider.get_market_price_data(["AAPL"])
         
-        self.assertEqual(mock_yf_ticker.call_count, 1)
-        self.assertEqual(mock_yf_download.call_count, 1)
+        self.assertEqual(self.mock_yf_ticker.call_count, 1)
+        self.assertEqual(self.mock_yf_download.call_count, 1)
         self.assertEqual(
             market_provider._price_cache["AAPL"]["data"]["previous_close"], 100.0
         )
@@ -163,29 +264,22 @@ class TestMarketProvider(unittest.TestCase):
         mock_dt.now.return_value = day2_noon_utc
         mock_pd_now.return_value = day2_noon_ny
 
-        mock_ticker_obj2 = MagicMock()
-        mock_ticker_obj2.info = {
-            "regularMarketPreviousClose": 105.0,
-            "currency": "USD",
-            "exchange": "NYSE",
-        }
-        mock_ticker_obj2.fast_info = {"lastPrice": 110.0}
-        mock_yf_ticker.return_value = mock_ticker_obj2
+        self.mock_yf_ticker.return_value = _make_ticker_mock(110.0, 105.0)
 
         mock_df2 = pd.DataFrame(
             {( "Close", "AAPL"): [110.0], ("High", "AAPL"): [111.0], ("Low", "AAPL"): [109.0], ("Open", "AAPL"): [105.0], ("Volume", "AAPL"): [1100]},
             index=[day2_noon_ny]
         )
         mock_df2.columns = pd.MultiIndex.from_tuples(mock_df2.columns)
-        mock_yf_download.return_value = mock_df2
+        self.mock_yf_download.return_value = mock_df2
 
         # 4. --- Trigger the function again (no force refresh) ---
         market_provider.get_market_price_data(["AAPL"], force_refresh=False)
 
         # 5. --- Assert the correct behavior ---
         # It should have called Ticker again because of expiry
-        self.assertEqual(mock_yf_ticker.call_count, 2)
-        self.assertEqual(mock_yf_download.call_count, 2)
+        self.assertEqual(self.mock_yf_ticker.call_count, 2)
+        self.assertEqual(self.mock_yf_download.call_count, 2)
         self.assertEqual(
             market_provider._price_cache["AAPL"]["data"]["previous_close"], 105.0
         )
@@ -201,10 +295,9 @@ class TestMarketProvider(unittest.TestCase):
             "Unknown exchange should default to Open (fallback behavior)",
         )
 
-    @patch("stockstui.data_providers.market_provider.yf.Ticker")
     @patch("stockstui.data_providers.market_provider.pd")
     @patch("stockstui.data_providers.market_provider.mcal")
-    def test_gspc_exchange_mapping(self, mock_mcal, mock_pd, mock_ticker):
+    def test_gspc_exchange_mapping(self, mock_mcal, mock_pd):
         """Test correct mapping of SNP/GSPC to NYSE and status check."""
         import logging
 
@@ -224,7 +317,7 @@ class TestMarketProvider(unittest.TestCase):
             lambda tz=None: mock_now.astimezone(tz) if tz else mock_now
         )
 
-        mock_instance = mock_ticker.return_value
+        mock_instance = self.mock_yf_ticker.return_value
         mock_instance.info = {"exchange": "SNP", "currency": "USD"}
         mock_pd.Timestamp.side_effect = lambda *args, **kwargs: real_pd.Timestamp(
             *args, **kwargs
@@ -260,8 +353,7 @@ class TestMarketProvider(unittest.TestCase):
         )
         self.assertEqual(status["status"], "closed", "Should be closed at 2:00 AM")
 
-    @patch("stockstui.data_providers.market_provider.yf.download")
-    def test_fast_data_does_not_overwrite_with_none(self, mock_yf_download):
+    def test_fast_data_does_not_overwrite_with_none(self):
         """
         Test that if fast data returns None for day_high/day_low,
         it does NOT overwrite existing valid values in the cache.
@@ -292,7 +384,7 @@ class TestMarketProvider(unittest.TestCase):
             index=[pd.Timestamp.now(tz="UTC")]
         )
         mock_df.columns = pd.MultiIndex.from_tuples(mock_df.columns)
-        mock_yf_download.return_value = mock_df
+        self.mock_yf_download.return_value = mock_df
 
         # 3. Trigger update
         with patch(
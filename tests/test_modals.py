@@ -1,6 +1,7 @@
 import unittest
 
 from textual.app import App
+from textual.widgets import Input
 from stockstui.ui.modals import (
     ConfirmDeleteModal,
     AddListModal,
@@ -20,6 +21,12 @@ class ModalsTestApp(App):
     pass
 
 
+async def _set_input(pilot, selector: str, text: str) -> None:
+    """Fills an Input in one step instead of pressing a key per character."""
+    pilot.app.screen.query_one(selector, Input).value = text
+    await pilot.pause()
+
+
 class TestModals(unittest.IsolatedAsyncioTestCase):
     """
     Unit tests for all modal dialogs.
@@ -68,7 +75,7 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
             # Test add
             await pilot.app.push_screen(AddListModal(), set_result)
             await pilot.pause()
-            await pilot.press("t", "e", "s", "t", " ", "l", "i", "s", "t")
+            await _set_input(pilot, "#list-name-input", "test list")
             await pilot.click("#add")
             await pilot.pause()
             self.assertEqual(result, "test_list")
@@ -94,10 +101,7 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
             await pilot.app.push_screen(EditListModal(current_value), set_result)
             await pilot.pause()
 
-            # FIX: Clear the input before typing to prevent overwriting selected text.
-            for _ in current_value:
-                await pilot.press("backspace")
-            await pilot.press("n", "e", "w", "_", "n", "a", "m", "e")
+            await _set_input(pilot, "#list-name-input", "new_name")
 
             await pilot.click("#save")
             await pilot.pause()
@@ -115,27 +119,10 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
 
             await pilot.app.push_screen(AddTickerModal(), set_result)
             await pilot.pause()
-            await pilot.press(
-                "a",
-                "a",
-                "p",
-                "l",
-                "tab",
-                "a",
-                "p",
-                "p",
-                "l",
-                "e",
-                "tab",
-                "n",
-                "o",
-                "t",
-                "e",
-                "tab",
-                "t",
-                "a",
-                "g",
-            )
+            await _set_input(pilot, "#ticker-input", "aapl")
+            await _set_input(pilot, "#alias-input", "apple")
+            await _set_input(pilot, "#note-input", "note")
+            await _set_input(pilot, "#tags-input", "tag")
             await pilot.click("#add")
             await pilot.pause()
             self.assertEqual(result, ("AAPL", "apple", "note", "tag"))
@@ -155,12 +142,7 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
                 EditTickerModal("TICK", current_alias, "note", "tags"), set_result
             )
             await pilot.pause()
-            await pilot.press("tab")  # Focus the alias input
-
-            # FIX: Clear and re-type to avoid selection issues.
-            for _ in current_alias:
-                await pilot.press("backspace")
-            await pilot.press("n", "e", "w", "_", "a", "l", "i", "a", "s")
+            await _set_input(pilot, "#alias-input", "new_alias")
 
             await pilot.click("#save")
             await pilot.pause()
@@ -178,7 +160,8 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
 
             await pilot.app.push_screen(CreatePortfolioModal(), set_result)
             await pilot.pause()
-            await pilot.press("n", "a", "m", "e", "tab", "d", "e", "s", "c")
+            await _set_input(pilot, "#name-input", "name")
+            await _set_input(pilot, "#description-input", "desc")
             await pilot.click("#create")
             await pilot.pause()
             self.assertEqual(result, ("name", "desc"))
@@ -199,10 +182,7 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
             )
             await pilot.pause()
 
-            # FIX: Clear and re-type to avoid selection issues.
-            for _ in current_name:
-                await pilot.press("backspace")
-            await pilot.press("n", "e", "w", "_", "n", "a", "m", "e")
+            await _set_input(pilot, "#name-input", "new_name")
 
             await pilot.click("#save")
             await pilot.pause()
@@ -224,19 +204,9 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
             )
             await pilot.pause()
 
-            # Clear inputs
-            await pilot.click("#quantity-input")
-            # Clear existing value (check modal init for value)
-            # Init with quantity 10 -> "10" (length 2)
-            for _ in range(5):
-                await pilot.press("backspace", "delete")
-            await pilot.press("2", "0")
-
-            await pilot.click("#cost-input")
-            # Init with avg_cost 150.0 -> "150.0" (length 5)
-            for _ in range(10):
-                await pilot.press("backspace", "delete")
-            await pilot.press("1", "5", "5")
+            # Overwrite the pre-filled quantity ("10") and cost ("150.0")
+            await _set_input(pilot, "#quantity-input", "20")
+            await _set_input(pilot, "#cost-input", "155")
 
             await pilot.click("#save")
             await pilot.pause()
@@ -270,13 +240,8 @@ class TestModals(unittest.IsolatedAsyncioTestCase):
             )
             await pilot.pause()
 
-            # Should be focused on value input of alias
-            # Clear and type new alias
-            await pilot.click("#value-input")
-            # 'OldAlias' length is 8
-            for _ in range(15):
-                await pilot.press("backspace", "delete")
-            await pilot.press("N", "e", "w", "A", "l", "i", "a", "s")
+            # Overwrite the pre-filled alias ("OldAlias")
+            await _set_input(pilot, "#value-input", "NewAlias")
 
             await pilot.click("#save")
             await pilot.pause()
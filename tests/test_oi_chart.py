@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch, PropertyMock
 import pandas as pd
-from stockstui.ui.widgets.oi_chart import OIChart
+from stockstui.ui.widgets.oi_chart import OIChart, format_large_num
 
 
 class TestOIChart(unittest.TestCase):
@@ -117,6 +117,14 @@ class TestOIChart(unittest.TestCase):
             # multiple_bar should NOT be called for empty data
             mock_plt.multiple_bar.assert_not_called()
 
+    def test_format_large_num(self):
+        """Test compact axis labels for thousands and millions."""
+        self.assertEqual(format_large_num(0), "0")
+        self.assertEqual(format_large_num(750), "750")
+        self.assertEqual(format_large_num(2000), "2K")
+        self.assertEqual(format_large_num(1500), "1.5K")
+        self.assertEqual(format_large_num(2_500_000), "2.5M")
+
     def test_chart_with_empty_calls(self):
         """Test chart with empty calls dataframe."""
         empty_calls = pd.DataFrame(columns=["strike", "openInterest", "contractSymbol"])
@@ -35,7 +35,10 @@ async def create_test_app() -> StocksTUI:
 
     app.mount()
     await app.workers.wait_for_complete()
-    await asyncio.sleep(0.01)
+    # Let callbacks scheduled by mount/worker completion run; a few cooperative
+    # yields are enough and, unlike a fixed sleep, cost nothing on fast machines.
+    for _ in range(3):
+        await asyncio.sleep(0)
     app.push_screen = MagicMock()
 
     return app